@@ -8,6 +8,8 @@ Usage:
     3. Analyze differences to make data-driven decisions
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import io
 from langsmith import Client
 from langsmith.evaluation import evaluate
 import json
@@ -21,6 +23,7 @@ def run_evaluation(
     evaluators: list,
     experiment_prefix: str,
     metadata: dict = None,
+    max_concurrency: int = 10,
 ):
     """Run evaluation and return results.
 
@@ -30,18 +33,37 @@ def run_evaluation(
         evaluators: List of evaluator functions
         experiment_prefix: Prefix for experiment name (e.g., "langgraph_v1")
         metadata: Optional metadata to attach to experiment
+        max_concurrency: Examples evaluated in parallel. Keep this within your
+            agent's and judge model's rate limits.
 
     Returns:
         Evaluation results object
     """
+    # Optional: report judge cache use when the evaluator templates are available
+    try:
+        from templates.evaluators import judge_cache_stats
+    except ImportError:
+        judge_cache_stats = None
+
+    # Snapshot the process-wide judge cache counts to report only this run's
+    stats_before = judge_cache_stats() if judge_cache_stats else None
+
     results = evaluate(
         agent_fn,
         data=dataset_name,
         evaluators=evaluators,
         experiment_prefix=experiment_prefix,
         metadata=metadata or {},
+        max_concurrency=max_concurrency,
     )
 
+    if judge_cache_stats:
+        stats = judge_cache_stats()
+        hits = stats["hits"] - stats_before["hits"]
+        misses = stats["misses"] - stats_before["misses"]
+        if hits or misses:
+            print(f"Judge cache: {hits} hits, {misses} misses")
+
     return results
 
 
@@ -58,124 +80,148 @@ def compare_experiments(
     Returns:
         Comparison dict with metrics for each experiment
     """
-    comparison = {}
-
-    for exp_name in experiment_names:
-        # Get experiment results
-        experiments = list(client.list_runs(
+    if not experiment_names:
+        return {}
+
+    def _fetch_exp(exp_name: str) -> tuple[str, dict | None]:
+        # Stream runs and only request feedback_stats - inputs/outputs of large
+        # traces are never downloaded, and each run is dropped after it's counted.
+        exp_metrics = {}  # key -> (sum, count)
+        run_count = 0
+        runs = client.list_runs(
             project_name=exp_name,
             is_root=True,
-        ))
-
-        if not experiments:
-            print(f"Warning: No runs found for {exp_name}")
-            continue
-
-        # Aggregate metrics
-        exp_metrics = {}
-        for run in experiments:
+            select=["feedback_stats"],
+        )
+        for run in runs:
+            run_count += 1
             if run.feedback_stats:
                 for key, stats in run.feedback_stats.items():
                     if metrics and key not in metrics:
                         continue
-                    if key not in exp_metrics:
-                        exp_metrics[key] = []
-                    exp_metrics[key].append(stats.get("avg", 0))
+                    total, count = exp_metrics.get(key, (0.0, 0))
+                    exp_metrics[key] = (total + stats.get("avg", 0), count + 1)
+
+        if not run_count:
+            return exp_name, None
 
         # Calculate averages
-        comparison[exp_name] = {
-            key: sum(vals) / len(vals) if vals else 0
-            for key, vals in exp_metrics.items()
+        return exp_name, {
+            key: total / count if count else 0
+            for key, (total, count) in exp_metrics.items()
         }
 
+    # Each experiment fetch is independent network I/O, so run them in parallel.
+    # The shared client keeps one HTTP session, so connections are reused.
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(experiment_names))) as pool:
+        futures = [pool.submit(_fetch_exp, exp_name) for exp_name in experiment_names]
+        for future in as_completed(futures):
+            exp_name, exp_metrics = future.result()
+            results[exp_name] = exp_metrics
+
+    # Preserve the caller's experiment order
+    comparison = {}
+    for exp_name in experiment_names:
+        if results[exp_name] is None:
+            print(f"Warning: No runs found for {exp_name}")
+            continue
+        comparison[exp_name] = results[exp_name]
+
     return comparison
 
 
+def _build_comparison_matrix(comparison: dict) -> tuple[list, list, list]:
+    """Tabulate a comparison once as (exp_names, metrics, matrix).
+
+    matrix[i][j] is metric i's value for experiment j (0.0 if missing).
+    """
+    exp_names = list(comparison.keys())
+    all_metrics = set()
+    for exp_metrics in comparison.values():
+        all_metrics.update(exp_metrics.keys())
+    metrics = sorted(all_metrics)
+
+    matrix = [[comparison[exp_name].get(metric, 0.0) for exp_name in exp_names] for metric in metrics]
+    return exp_names, metrics, matrix
+
+
 def print_comparison(comparison: dict):
     """Print comparison results in a readable format."""
     if not comparison:
         print("No comparison data available")
         return
 
-    # Get all metric keys
-    all_metrics = set()
-    for exp_metrics in comparison.values():
-        all_metrics.update(exp_metrics.keys())
+    exp_names, metrics, matrix = _build_comparison_matrix(comparison)
 
     # Print header
-    exp_names = list(comparison.keys())
     header = f"{'Metric':<25} | " + " | ".join(f"{name:<15}" for name in exp_names)
     print(header)
     print("-" * len(header))
 
-    # Print each metric
-    for metric in sorted(all_metrics):
-        row = f"{metric:<25} | "
-        values = []
-        for exp_name in exp_names:
-            val = comparison[exp_name].get(metric, 0)
-            values.append(val)
-            row += f"{val:>15.3f} | "
-        print(row)
+    # Print each metric (row template built once, not per row)
+    row_fmt = "{:<25} | " + " | ".join("{:>15.3f}" for _ in exp_names)
+    for metric, values in zip(metrics, matrix):
+        print(row_fmt.format(metric, *values))
 
         # Highlight winner
         if values and max(values) != min(values):
-            winner_idx = values.index(max(values))
+            winner_idx = max(range(len(values)), key=values.__getitem__)
             print(f"  -> Best: {exp_names[winner_idx]}")
 
 
 def generate_report(comparison: dict, output_file: str = None) -> str:
     """Generate a markdown comparison report.
 
+    Lines are written as they're generated - straight to output_file when
+    given, so the full report is never held in memory.
+
     Args:
         comparison: Comparison dict from compare_experiments()
         output_file: Optional file path to save report
 
     Returns:
-        Markdown report string
+        Markdown report string, or output_file's path when saving to a file
     """
-    report = ["# Experiment Comparison Report\n"]
+    out = open(output_file, "w") if output_file else io.StringIO()
+    with out:
+        _write_report(comparison, out)
+        if not output_file:
+            return out.getvalue()
 
-    if not comparison:
-        report.append("No comparison data available.\n")
-        return "\n".join(report)
+    print(f"Report saved to: {output_file}")
+    return output_file
 
-    # Summary table
-    report.append("## Summary\n")
-    report.append("| Metric | " + " | ".join(comparison.keys()) + " |")
-    report.append("|" + "---|" * (len(comparison) + 1))
 
-    all_metrics = set()
-    for exp_metrics in comparison.values():
-        all_metrics.update(exp_metrics.keys())
+def _write_report(comparison: dict, out):
+    out.write("# Experiment Comparison Report\n\n")
+
+    if not comparison:
+        out.write("No comparison data available.\n")
+        return
+
+    exp_names, metrics, matrix = _build_comparison_matrix(comparison)
 
-    for metric in sorted(all_metrics):
-        row = f"| {metric} |"
-        values = []
-        for exp_name in comparison:
-            val = comparison[exp_name].get(metric, 0)
-            values.append(val)
-            # Bold the best value
-            if values and val == max(values):
-                row += f" **{val:.3f}** |"
-            else:
-                row += f" {val:.3f} |"
-        report.append(row)
+    # Summary table
+    out.write("## Summary\n\n")
+    out.write("| Metric | " + " | ".join(exp_names) + " |\n")
+    out.write("|" + "---|" * (len(exp_names) + 1) + "\n")
+
+    for metric, values in zip(metrics, matrix):
+        best = max(values)
+        # Bold the best value
+        out.write(f"| {metric} |" + "".join(
+            f" **{val:.3f}** |" if val == best else f" {val:.3f} |"
+            for val in values
+        ) + "\n")
 
     # Recommendations
-    report.append("\n## Recommendations\n")
+    out.write("\n## Recommendations\n\n")
 
     # Find overall winner
-    totals = {exp: sum(metrics.values()) for exp, metrics in comparison.items()}
+    totals = {exp: sum(exp_metrics.values()) for exp, exp_metrics in comparison.items()}
     winner = max(totals, key=totals.get)
-    report.append(f"- **Overall Best**: {winner} (highest total score)")
-
-    if output_file:
-        with open(output_file, "w") as f:
-            f.write("\n".join(report))
-        print(f"Report saved to: {output_file}")
-
-    return "\n".join(report)
+    out.write(f"- **Overall Best**: {winner} (highest total score)\n")
 
 
 # === EXAMPLE USAGE ===
@@ -0,0 +1,21 @@
+"""Precompiled evaluation criteria shared by dataset.py and evaluators.py.
+
+dataset.py stores compile_criteria(outputs) in each example's metadata when
+the example is created; evaluators.py reads it back so keywords aren't
+re-lowercased on every run. No third-party dependencies.
+"""
+
+
+def compile_criteria(outputs: dict) -> dict:
+    """Precompute what the evaluators check, so they don't redo it per run.
+
+    After editing an example's outputs, refresh its snapshot with
+    dataset.compile_examples().
+    """
+    should_mention = list(outputs.get("should_mention") or [])
+    return {
+        "expected_fields": list(outputs.get("expected_fields") or []),
+        "should_mention": should_mention,
+        "mention_lc": [kw.lower() for kw in should_mention],
+        "min_report_length": int(outputs.get("min_report_length") or 0),
+    }
@@ -3,13 +3,18 @@
 This template provides starter code for creating evaluation datasets.
 
 Usage:
-    1. Copy this file to your project
+    1. Copy this file (and criteria.py) to your project
     2. Customize SAMPLE_TEST_CASES for your use case
     3. Run: python dataset.py
 """
 
 from langsmith import Client
 
+try:
+    from templates.criteria import compile_criteria
+except ImportError:  # Run as a script: python templates/dataset.py
+    from criteria import compile_criteria
+
 client = Client()
 
 
@@ -95,6 +100,29 @@ SAMPLE_TEST_CASES = [
 ]
 
 
+def compile_examples(dataset_name: str) -> int:
+    """Add or refresh precomputed criteria, e.g. after editing example outputs.
+
+    Args:
+        dataset_name: Name of LangSmith dataset to update
+
+    Returns:
+        Number of examples updated
+    """
+    updated = 0
+    for example in client.list_examples(dataset_name=dataset_name):
+        metadata = dict(example.metadata or {})
+        compiled = compile_criteria(example.outputs or {})
+        if metadata.get("_compiled") == compiled:
+            continue
+        metadata["_compiled"] = compiled
+        client.update_example(example.id, metadata=metadata)
+        updated += 1
+
+    print(f"Compiled criteria for {updated} examples in {dataset_name}")
+    return updated
+
+
 def create_dataset(
     name: str = "my_eval_dataset",
     description: str = "Evaluation dataset created with Eval Coach",
@@ -122,18 +150,32 @@ def create_dataset(
         dataset = client.create_dataset(name, description=description)
         print(f"Created dataset: {name}")
 
-    # Add test cases
-    for case in test_cases:
-        client.create_example(
+    # Only upload cases not already in the dataset, so re-runs don't duplicate rows
+    new_cases = test_cases
+    if existing:
+        existing_names = {
+            (ex.metadata or {}).get("name")
+            for ex in client.list_examples(dataset_id=dataset.id)
+        }
+        existing_names.discard(None)
+        new_cases = [case for case in test_cases if case.get("name") not in existing_names]
+
+    # Add new test cases in one bulk request
+    if new_cases:
+        client.create_examples(
             dataset_id=dataset.id,
-            inputs=case["inputs"],
-            outputs=case.get("outputs", {}),
-            metadata={
-                "name": case.get("name", "unnamed"),
-                "category": case.get("category", "unknown"),
-            },
+            inputs=[case["inputs"] for case in new_cases],
+            outputs=[case.get("outputs", {}) for case in new_cases],
+            metadata=[
+                {
+                    "name": case.get("name", "unnamed"),
+                    "category": case.get("category", "unknown"),
+                    "_compiled": compile_criteria(case.get("outputs", {})),
+                }
+                for case in new_cases
+            ],
         )
-        print(f"  Added: {case.get('name', 'unnamed')} ({case.get('category', 'unknown')})")
+    print(f"  Added {len(new_cases)} examples ({len(test_cases) - len(new_cases)} already present)")
 
     # Print summary
     categories = {}
@@ -9,15 +9,177 @@ Evaluator Types:
 
 Configuration:
 - Set JUDGE_MODEL env var to customize LLM judge (default: gemini-3-flash-preview)
+- Set MAX_CONCURRENT_JUDGE_CALLS env var to cap in-flight judge requests (default: 8)
+- Set JUDGE_CACHE_DIR env var to move the judge response cache (default: ~/.eval-coach/judge_cache, "" disables)
 """
 
+import hashlib
 import json
+import logging
 import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from langsmith.schemas import Run, Example
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+try:
+    from templates.criteria import compile_criteria
+except ImportError:  # Copied into your project next to criteria.py
+    from criteria import compile_criteria
+
+# Errors the judge client raises for 429s and 5xx once its own retries run out
+try:
+    from google.genai.errors import ServerError
+    from langchain_google_genai.chat_models import GoogleRateLimitError
+    TRANSIENT_JUDGE_ERRORS = (GoogleRateLimitError, ServerError)
+except ImportError:  # Older langchain-google-genai releases
+    TRANSIENT_JUDGE_ERRORS = ()
+
+# Optional: pip install pyahocorasick for single-pass keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configurable judge model - set JUDGE_MODEL env var to override
 JUDGE_MODEL = os.getenv("JUDGE_MODEL", "gemini-3-flash-preview")
+# Judges return a short JSON verdict; cap output so a runaway response can't stall a batch
+JUDGE_MAX_TOKENS = 500
+# Max judge requests in flight across all threads - match your Gemini quota
+# (at least 1 - zero would deadlock the semaphore and break the judge pool)
+MAX_CONCURRENT_JUDGE_CALLS = max(1, int(os.getenv("MAX_CONCURRENT_JUDGE_CALLS", "8")))
+# On-disk judge response cache - set JUDGE_CACHE_DIR="" to disable
+JUDGE_CACHE_DIR = os.path.expanduser(os.getenv("JUDGE_CACHE_DIR", "~/.eval-coach/judge_cache"))
+JUDGE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+logger = logging.getLogger(__name__)
+
+# Shared judge client - created on first use and reused by every judge call,
+# so credentials and HTTP connections aren't set up again per run
+_JUDGE_LLM = None
+
+
+def _get_judge() -> ChatGoogleGenerativeAI:
+    """Return the shared LLM judge client."""
+    global _JUDGE_LLM
+    if _JUDGE_LLM is None:
+        _JUDGE_LLM = ChatGoogleGenerativeAI(
+            model=JUDGE_MODEL,
+            temperature=0,
+            max_output_tokens=JUDGE_MAX_TOKENS,
+            # JSON mode - keeps markdown fences and chatter out of the verdict
+            response_mime_type="application/json",
+        )
+    return _JUDGE_LLM
+
+
+# Judge calls come from evaluate()'s worker threads, combined_judges()'s pool, and
+# BatchJudgeRunner, so the cap is one semaphore shared across threads
+_JUDGE_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_JUDGE_CALLS)
+
+
+def _invoke_judge(prompt: str) -> str:
+    """Send one prompt to the judge and return its text.
+
+    Rate limits and server errors are retried with backoff by the client
+    itself (ChatGoogleGenerativeAI's max_retries, 6 by default).
+    """
+    with _JUDGE_SLOTS:
+        return _get_judge().invoke(prompt).content
+
+
+# === JUDGE RESPONSE CACHE ===
+# Judges run at temperature 0, so the same prompt on the same model gives the
+# same verdict. Re-scoring unchanged outputs (e.g. comparing experiments over
+# one dataset) reads the verdict from disk instead of calling the judge again.
+
+_judge_cache_stats = {"hits": 0, "misses": 0}
+_judge_cache_lock = threading.Lock()
+
+
+def _judge_cache_path(prompt: str) -> str:
+    key = hashlib.blake2b(prompt.encode() + JUDGE_MODEL.encode()).hexdigest()
+    return os.path.join(JUDGE_CACHE_DIR, f"{key}.txt")
+
+
+def _read_judge_cache(prompt: str) -> str | None:
+    """Return a fresh cached response for prompt, or None (counted as a miss)."""
+    if not JUDGE_CACHE_DIR:
+        return None
+
+    try:
+        path = _judge_cache_path(prompt)
+        if time.time() - os.path.getmtime(path) < JUDGE_CACHE_TTL_SECONDS:
+            with open(path) as f:
+                content = f.read()
+            with _judge_cache_lock:
+                _judge_cache_stats["hits"] += 1
+            return content
+    except OSError:
+        pass
+
+    with _judge_cache_lock:
+        _judge_cache_stats["misses"] += 1
+    return None
+
+
+def _write_judge_cache(prompt: str, content: str):
+    """Store a response; a failed write is logged, never turned into a judge error."""
+    if not JUDGE_CACHE_DIR:
+        return
+
+    path = _judge_cache_path(prompt)
+    tmp_path = None
+    try:
+        os.makedirs(JUDGE_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=JUDGE_CACHE_DIR, delete=False) as f:
+            tmp_path = f.name
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write judge cache %s: %s", path, e)
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def judge_cache_stats() -> dict:
+    """Return judge cache hit/miss counts for this process."""
+    with _judge_cache_lock:
+        return dict(_judge_cache_stats)
+
+
+# Criteria compiled on the fly for examples without a stored snapshot,
+# keyed by (example.id, modified_at) so an edited example is recompiled
+_compiled_criteria = {}
+_COMPILED_CRITERIA_MAX = 4096
+
+
+def _criteria(example: Example) -> dict:
+    """Return the example's precomputed evaluation criteria.
+
+    dataset.py stores these in example.metadata["_compiled"] at creation time
+    (keywords pre-lowercased, min length pre-cast); run compile_examples()
+    after editing outputs. Other examples are compiled once and memoized.
+    """
+    compiled = (example.metadata or {}).get("_compiled")
+    if compiled is not None:
+        return compiled
+
+    key = (example.id, example.modified_at)
+    try:
+        return _compiled_criteria[key]
+    except KeyError:
+        if len(_compiled_criteria) >= _COMPILED_CRITERIA_MAX:
+            _compiled_criteria.clear()
+        compiled = _compiled_criteria[key] = compile_criteria(example.outputs or {})
+        return compiled
 
 
 # === TIER 1: AUTOMATED EVALUATORS ===
@@ -27,12 +189,13 @@ def schema_evaluator(run: Run, example: Example) -> dict:
 
     Customize: Update expected_fields in your test cases.
     """
-    output = run.outputs or {}
-    expected = example.outputs.get("expected_fields", [])
+    expected = _criteria(example)["expected_fields"]
 
     if not expected:
         return {"key": "schema_valid", "score": 1.0, "comment": "No expected fields defined"}
 
+    output = run.outputs or {}
+
     present = [f for f in expected if output.get(f) is not None]
     missing = [f for f in expected if f not in present]
     score = len(present) / len(expected)
@@ -46,35 +209,60 @@ def keyword_coverage_evaluator(run: Run, example: Example) -> dict:
 
     Customize: Update should_mention in your test cases.
     """
-    output = run.outputs or {}
-    should_mention = example.outputs.get("should_mention", [])
+    criteria = _criteria(example)
+    should_mention = criteria["should_mention"]
 
     if not should_mention:
         return {"key": "keyword_coverage", "score": 1.0, "comment": "No keywords to check"}
 
     # Check all output fields for keywords
-    output_text = json.dumps(output).lower()
-    found = [kw for kw in should_mention if kw.lower() in output_text]
-    missing = [kw for kw in should_mention if kw.lower() not in output_text]
+    output_text = json.dumps(run.outputs or {}).lower()
+    if ahocorasick is not None:
+        automaton = _keyword_automaton(tuple(zip(should_mention, criteria["mention_lc"])))
+        matched = {kw for _, originals in automaton.iter(output_text) for kw in originals}
+    else:
+        matched = {kw for kw, kw_lc in zip(should_mention, criteria["mention_lc"]) if kw_lc in output_text}
+    found = [kw for kw in should_mention if kw in matched]
+    missing = [kw for kw in should_mention if kw not in matched]
     score = len(found) / len(should_mention)
 
     comment = f"All keywords found ({len(found)}/{len(should_mention)})" if score == 1.0 else f"Missing: {missing}"
     return {"key": "keyword_coverage", "score": score, "comment": comment}
 
 
+@lru_cache(maxsize=1024)
+def _keyword_automaton(keywords: tuple):
+    """Build (once per keyword set) an automaton that finds all keywords in one scan.
+
+    keywords holds (original, lowercased) pairs. Each lowercased word maps to
+    every original spelling, so "AI" and "ai" are both found by one match.
+    Cached on the keyword tuple, so the same dataset row reused across
+    experiments doesn't rebuild it.
+    """
+    originals_by_lc = {}
+    for kw, kw_lc in keywords:
+        originals_by_lc.setdefault(kw_lc, []).append(kw)
+
+    automaton = ahocorasick.Automaton()
+    for kw_lc, originals in originals_by_lc.items():
+        automaton.add_word(kw_lc, originals)
+    automaton.make_automaton()
+    return automaton
+
+
 def report_length_evaluator(run: Run, example: Example) -> dict:
     """Check if output meets length requirements.
 
     Customize: Update min_report_length in your test cases.
     """
+    min_len = _criteria(example)["min_report_length"]
+    if not min_len:
+        return {"key": "report_length", "score": 1.0, "comment": "No minimum length defined"}
+
     output = run.outputs or {}
     # Try common output field names
     response = output.get("final_report", "") or output.get("output", "") or output.get("response", "")
 
-    min_len = example.outputs.get("min_report_length", 0)
-    if not min_len:
-        return {"key": "report_length", "score": 1.0, "comment": "No minimum length defined"}
-
     actual = len(response)
     score = min(1.0, actual / min_len)
 
@@ -139,10 +327,12 @@ def token_efficiency_evaluator(run: Run, example: Example) -> dict:
     """
     max_tokens = example.outputs.get("max_tokens", 10000)
 
-    # Try to get token usage from run metadata
-    extra = run.extra or {}
-    token_usage = extra.get("token_usage", {})
-    total_tokens = token_usage.get("total_tokens", 0)
+    # LangSmith's own total across the trace; older SDKs only have run metadata
+    total_tokens = getattr(run, "total_tokens", None)
+    if not total_tokens:
+        extra = run.extra or {}
+        token_usage = extra.get("token_usage", {})
+        total_tokens = token_usage.get("total_tokens", 0)
 
     if not total_tokens:
         return {"key": "token_efficiency", "score": 0.5, "comment": "No token data available"}
@@ -157,22 +347,19 @@ def token_efficiency_evaluator(run: Run, example: Example) -> dict:
 
 
 # === TIER 2: LLM-AS-JUDGE EVALUATORS ===
+#
+# Each judge is split into two phases so it can run either one call at a time
+# (inside evaluate()) or batched across many runs (see BatchJudgeRunner):
+# - prepare(run, example) -> prompt string, or a final feedback dict to short-circuit
+# - finalize(content) -> feedback dict parsed from the judge's response
+#
+# Prompts are module-level templates filled with str.format(); customize the
+# rubrics here.
 
-def quality_evaluator(run: Run, example: Example) -> dict:
-    """Evaluate output quality using LLM-as-Judge.
-
-    Customize: Update the rubric in the prompt below.
-    """
-    output = run.outputs or {}
-    response = output.get("final_report", "") or output.get("output", "") or output.get("response", "")
-
-    if not response:
-        return {"key": "quality", "score": 0.0, "comment": "No output to evaluate"}
-
-    judge_prompt = f"""Evaluate this output on a scale of 1-5.
+QUALITY_PROMPT = """Evaluate this output on a scale of 1-5.
 
 Output to evaluate:
-{response[:3000]}
+{response}
 
 Rubric:
 - 5: Excellent - comprehensive, accurate, well-structured
@@ -184,71 +371,136 @@ Rubric:
 Return JSON: {{"score": 1-5, "reasoning": "brief explanation"}}
 """
 
-    try:
-        llm = ChatGoogleGenerativeAI(model=JUDGE_MODEL, temperature=0)
-        result = llm.invoke(judge_prompt)
-        parsed = json.loads(result.content)
-
-        return {
-            "key": "quality",
-            "score": parsed["score"] / 5.0,
-            "comment": parsed.get("reasoning", ""),
-        }
-    except Exception as e:
-        return {"key": "quality", "score": 0.5, "comment": f"Judge error: {e}"}
+RELEVANCE_PROMPT = """Is this response relevant to the query?
 
+Query: {query}
+Response: {response}
 
-def relevance_evaluator(run: Run, example: Example) -> dict:
-    """Check if output is relevant to input.
+Score 1-5:
+- 5: Directly addresses the query
+- 3: Partially relevant
+- 1: Off-topic or irrelevant
+
+Return JSON: {{"score": 1-5, "reasoning": "brief explanation"}}
+"""
+
+CONSISTENCY_PROMPT = """Analyze this research report for input-data consistency.
+
+USER INPUT:
+- Target: {target}
+- Company claimed: {company}
+
+REPORT:
+{report}
+
+QUESTIONS:
+1. Does the report confirm the person actually works at "{company}"?
+2. If the source data shows a DIFFERENT company, did the agent:
+   a) Explicitly flag the mismatch? (GOOD)
+   b) Silently reconcile by finding tangential connections? (BAD)
+   c) Ignore the mismatch entirely? (BAD)
+
+SCORING:
+- 1.0: Data matches OR agent explicitly flagged mismatch
+- 0.5: Minor discrepancy, agent partially addressed
+- 0.0: Major mismatch silently reconciled (hallucination risk)
+
+Return JSON: {{"score": 0.0-1.0, "mismatch_found": true/false, "reasoning": "explanation"}}
+"""
+
+
+def _quality_prepare(run: Run, example: Example) -> str | dict:
+    output = run.outputs or {}
+    response = output.get("final_report", "") or output.get("output", "") or output.get("response", "")
+
+    if not response:
+        return {"key": "quality", "score": 0.0, "comment": "No output to evaluate"}
+
+    return QUALITY_PROMPT.format(response=response[:3000])
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_json_object(content: str) -> dict | None:
+    """Decode the first JSON object in content, ignoring fences or prose around it."""
+    start = content.find("{")
+    while start != -1:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(content, start)
+            if isinstance(parsed, dict):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+        start = content.find("{", start + 1)
+    return None
 
-    Customize: Update relevance criteria in the prompt.
+
+def _extract_json(content: str) -> dict:
+    """Parse the judge's JSON verdict, tolerating surrounding text.
+
+    Unparseable output is logged with the raw response and raised, so it
+    shows up in the feedback comment instead of passing as a plain 0.5.
+    """
+    parsed = _parse_json_object(content)
+    if parsed is not None:
+        return parsed
+
+    logger.warning("Unparseable judge output: %r", content[:1000])
+    raise ValueError(f"Unparseable judge output: {content[:200]!r}")
+
+
+def _quality_finalize(content: str) -> dict:
+    parsed = _extract_json(content)
+    return {
+        "key": "quality",
+        "score": parsed["score"] / 5.0,
+        "comment": parsed.get("reasoning", ""),
+    }
+
+
+def quality_evaluator(run: Run, example: Example) -> dict:
+    """Evaluate output quality using LLM-as-Judge.
+
+    Customize: Update the rubric in QUALITY_PROMPT.
     """
+    return _run_judge("quality", _quality_prepare, _quality_finalize, run, example)
+
+
+def _relevance_prepare(run: Run, example: Example) -> str | dict:
     inputs = run.inputs or {}
     output = run.outputs or {}
 
-    query = inputs.get("query", "") or inputs.get("target", "") or str(inputs)[:500]
+    # Fall back to the first input value rather than str(inputs), which would
+    # repr every (possibly huge) value only to keep 500 chars
+    query = inputs.get("query") or inputs.get("target") or next(iter(inputs.values()), "")
+    query = query[:500] if isinstance(query, str) else repr(query)[:500]
     response = output.get("final_report", "") or output.get("output", "") or output.get("response", "")
 
     if not response:
         return {"key": "relevance", "score": 0.0, "comment": "No output to evaluate"}
 
-    judge_prompt = f"""Is this response relevant to the query?
+    return RELEVANCE_PROMPT.format(query=query, response=response[:2000])
 
-Query: {query}
-Response: {response[:2000]}
 
-Score 1-5:
-- 5: Directly addresses the query
-- 3: Partially relevant
-- 1: Off-topic or irrelevant
-
-Return JSON: {{"score": 1-5, "reasoning": "brief explanation"}}
-"""
+def _relevance_finalize(content: str) -> dict:
+    parsed = _extract_json(content)
+    return {
+        "key": "relevance",
+        "score": parsed["score"] / 5.0,
+        "comment": parsed.get("reasoning", ""),
+    }
 
-    try:
-        llm = ChatGoogleGenerativeAI(model=JUDGE_MODEL, temperature=0)
-        result = llm.invoke(judge_prompt)
-        parsed = json.loads(result.content)
-
-        return {
-            "key": "relevance",
-            "score": parsed["score"] / 5.0,
-            "comment": parsed.get("reasoning", ""),
-        }
-    except Exception as e:
-        return {"key": "relevance", "score": 0.5, "comment": f"Judge error: {e}"}
 
+def relevance_evaluator(run: Run, example: Example) -> dict:
+    """Check if output is relevant to input.
 
-def input_data_consistency_evaluator(run: Run, example: Example) -> dict:
-    """Check if report conclusions match the gathered source data.
+    Customize: Update relevance criteria in RELEVANCE_PROMPT.
+    """
+    return _run_judge("relevance", _relevance_prepare, _relevance_finalize, run, example)
 
-    CRITICAL: This evaluator catches when an agent silently reconciles
-    contradictory information instead of flagging it or asking for clarification.
 
-    Example: User provides company="Anthropic" but LinkedIn shows company="onsa.ai"
-    - BAD: Agent writes "engaged with Anthropic via community work" (silent reconciliation)
-    - GOOD: Agent flags the mismatch explicitly
-    """
+def _consistency_prepare(run: Run, example: Example) -> str | dict:
     inputs = run.inputs or {}
     output = run.outputs or {}
 
@@ -260,45 +512,139 @@ def input_data_consistency_evaluator(run: Run, example: Example) -> dict:
     if not report or not company:
         return {"key": "input_data_consistency", "score": 1.0, "comment": "No company/report to verify"}
 
-    judge_prompt = f"""Analyze this research report for input-data consistency.
+    return CONSISTENCY_PROMPT.format(target=target, company=company, report=report[:3000])
 
-USER INPUT:
-- Target: {target}
-- Company claimed: {company}
 
-REPORT:
-{report[:3000]}
+def _consistency_finalize(content: str) -> dict:
+    result = _extract_json(content)
+    return {
+        "key": "input_data_consistency",
+        "score": result.get("score", 0.5),
+        "comment": f"Mismatch: {result.get('mismatch_found', 'unknown')} - {result.get('reasoning', '')}",
+    }
 
-QUESTIONS:
-1. Does the report confirm the person actually works at "{company}"?
-2. If the source data shows a DIFFERENT company, did the agent:
-   a) Explicitly flag the mismatch? (GOOD)
-   b) Silently reconcile by finding tangential connections? (BAD)
-   c) Ignore the mismatch entirely? (BAD)
 
-SCORING:
-- 1.0: Data matches OR agent explicitly flagged mismatch
-- 0.5: Minor discrepancy, agent partially addressed
-- 0.0: Major mismatch silently reconciled (hallucination risk)
+def input_data_consistency_evaluator(run: Run, example: Example) -> dict:
+    """Check if report conclusions match the gathered source data.
+
+    CRITICAL: This evaluator catches when an agent silently reconciles
+    contradictory information instead of flagging it or asking for clarification.
+
+    Example: User provides company="Anthropic" but LinkedIn shows company="onsa.ai"
+    - BAD: Agent writes "engaged with Anthropic via community work" (silent reconciliation)
+    - GOOD: Agent flags the mismatch explicitly
+    """
+    return _run_judge("input_data_consistency", _consistency_prepare, _consistency_finalize, run, example)
 
-Return JSON: {{"score": 0.0-1.0, "mismatch_found": true/false, "reasoning": "explanation"}}
-"""
 
+def _judge_error(key: str, error: Exception) -> dict:
+    """Feedback for a judge call that produced no usable verdict."""
+    if isinstance(error, TRANSIENT_JUDGE_ERRORS):
+        # Leave unscored so rate limiting doesn't drag averages toward 0.5
+        return {"key": key, "score": None, "comment": f"Judge unavailable after retries: {error}"}
+    return {"key": key, "score": 0.5, "comment": f"Judge error: {error}"}
+
+
+def _judge_prompt(key: str, finalize, prompt: str) -> dict:
+    """Send a prepared prompt to the judge (or the cache) and finalize its response."""
+    content = _read_judge_cache(prompt)
+    from_cache = content is not None
     try:
-        llm = ChatGoogleGenerativeAI(model=JUDGE_MODEL, temperature=0)
-        response = llm.invoke(judge_prompt)
-        result = json.loads(response.content)
-        return {
-            "key": "input_data_consistency",
-            "score": result.get("score", 0.5),
-            "comment": f"Mismatch: {result.get('mismatch_found', 'unknown')} - {result.get('reasoning', '')}",
-        }
+        if content is None:
+            content = _invoke_judge(prompt)
+        feedback = finalize(content)
     except Exception as e:
-        return {"key": "input_data_consistency", "score": 0.5, "comment": f"Judge error: {e}"}
+        return _judge_error(key, e)
+
+    # Only cache responses that produced a verdict, so a bad one is retried next time
+    if not from_cache:
+        _write_judge_cache(prompt, content)
+    return feedback
+
+
+def _run_judge(key: str, prepare, finalize, run: Run, example: Example) -> dict:
+    """Run a single judge synchronously: prepare, invoke, finalize."""
+    prompt = prepare(run, example)
+    if isinstance(prompt, dict):
+        return prompt
+    return _judge_prompt(key, finalize, prompt)
+
+
+# (key, prepare, finalize) for every LLM judge
+JUDGES = [
+    ("quality", _quality_prepare, _quality_finalize),
+    ("relevance", _relevance_prepare, _relevance_finalize),
+    ("input_data_consistency", _consistency_prepare, _consistency_finalize),
+]
+
+
+# Shared pool for fanning out judges within combined_judges(); no event loop is
+# involved, so it also works from threads that already run one (Jupyter, aevaluate)
+_JUDGE_POOL = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JUDGE_CALLS, thread_name_prefix="judge")
+
+
+def combined_judges(run: Run, example: Example) -> dict:
+    """Run all LLM judges concurrently and report each as its own metric.
+
+    evaluate() calls evaluators one after another, so three separate judges
+    cost three judge round-trips per run. This issues them together, so a
+    run waits roughly one round-trip instead.
+    """
+    futures = [
+        _JUDGE_POOL.submit(_run_judge, key, prepare, finalize, run, example)
+        for key, prepare, finalize in JUDGES
+    ]
+    return {"results": [future.result() for future in futures]}
+
+
+class BatchJudgeRunner:
+    """Score many (run, example) pairs with all LLM judges in one concurrent batch.
+
+    evaluate() calls judges one run at a time, so N runs x 3 judges means 3N
+    serial round-trips. For re-scoring an existing experiment, collect the
+    pairs first and submit every prompt together instead.
+
+    Usage:
+        runner = BatchJudgeRunner()
+        for run, example in pairs:
+            runner.add(run, example)
+        results = runner.run()  # {run.id: [feedback dicts]}
+    """
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENT_JUDGE_CALLS):
+        self.max_concurrency = max_concurrency
+        self._results = {}   # run_id -> [feedback dicts]
+        self._pending = []   # (run_id, key, finalize, prompt)
+
+    def add(self, run: Run, example: Example):
+        """Prepare every judge's prompt for this run."""
+        feedback = self._results.setdefault(run.id, [])
+        for key, prepare, finalize in JUDGES:
+            prompt = prepare(run, example)
+            if isinstance(prompt, dict):
+                feedback.append(prompt)
+            else:
+                self._pending.append((run.id, key, finalize, prompt))
+
+    def run(self) -> dict:
+        """Submit all pending prompts as one batch and demux results by run."""
+        if self._pending:
+            run_ids, keys, finalizers, prompts = zip(*self._pending)
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                feedbacks = list(pool.map(_judge_prompt, keys, finalizers, prompts))
+            for run_id, feedback in zip(run_ids, feedbacks):
+                self._results[run_id].append(feedback)
+            self._pending = []
+
+        return self._results
 
 
 # === TIER 3: HUMAN-IN-THE-LOOP ===
 
+# Phrases that suggest the agent failed (matched case-insensitively in one pass)
+REVIEW_PATTERN = re.compile(r"error|sorry|unable to", re.IGNORECASE)
+
+
 def needs_human_review(run: Run, example: Example) -> dict:
     """Flag cases that need human review.
 
@@ -309,11 +655,9 @@ def needs_human_review(run: Run, example: Example) -> dict:
 
     # Customize these heuristics
     needs_review = (
-        len(response) < 200 or              # Too short
-        "error" in response.lower() or      # Contains error
-        "sorry" in response.lower() or      # Apology (often indicates failure)
-        "unable to" in response.lower() or  # Inability
-        run.error is not None               # Agent crashed
+        len(response) < 200 or                          # Too short
+        REVIEW_PATTERN.search(response) is not None or  # Error, apology, or inability
+        run.error is not None                           # Agent crashed
     )
 
     return {
@@ -337,10 +681,9 @@ PERFORMANCE_EVALUATORS = [
     token_efficiency_evaluator,
 ]
 
+# quality, relevance, and input_data_consistency - run concurrently per run
 LLM_JUDGE_EVALUATORS = [
-    quality_evaluator,
-    relevance_evaluator,
-    input_data_consistency_evaluator,
+    combined_judges,
 ]
 
 ALL_EVALUATORS = AUTOMATED_EVALUATORS + PERFORMANCE_EVALUATORS + LLM_JUDGE_EVALUATORS + [needs_human_review]